@@ -12,6 +12,13 @@ def main() -> None:
 
     conn = sqlite3.connect(cfg["db_path"])
     conn.execute("PRAGMA foreign_keys=ON;")
+    # WAL + synchronous=NORMAL: commits no longer fsync the main db file; the
+    # database stays consistent after a crash (only the last commits may be lost).
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-65536;")  # 64 MiB
+    conn.execute("PRAGMA mmap_size=268435456;")  # 256 MiB
     init_db(conn)
 
     mw = MediaWikiClient(
@@ -20,6 +20,7 @@ Usage (from repo root or this folder):
 
 Requirements:
   pip install requests
+  pip install orjson   (optional; faster JSON parsing, stdlib json is used otherwise)
 
 Notes:
   - Max limit per request is 500; this module paginates with offset until a short page.
@@ -35,11 +36,16 @@ import json
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 from urllib.parse import urlencode
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 CARGO_EXPORT_URL = "https://lol.fandom.com/wiki/Special:CargoExport"
 MAX_LIMIT = 500
 REQUEST_DELAY_SEC = 1.5
@@ -58,16 +64,18 @@ class CargoExportError(Exception):
     pass
 
 
-def _parse_cargo_json(text: str) -> List[Dict[str, Any]]:
+def _parse_cargo_json(text: Union[str, bytes]) -> List[Dict[str, Any]]:
     """Cargo usually returns a JSON array of objects; handle minor variants."""
     text = text.strip()
     if not text:
         return []
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError as e:
+        # Covers JSONDecodeError (both parsers) and UnicodeDecodeError on bad bytes
+        preview = text.decode("utf-8", "replace") if isinstance(text, bytes) else text
         raise CargoExportError(
-            f"Invalid JSON from Cargo (first 200 chars): {text[:200]!r}"
+            f"Invalid JSON from Cargo (first 200 chars): {preview[:200]!r}"
         ) from e
 
     if isinstance(data, list):
@@ -96,13 +104,18 @@ def cargo_export_request(
     if resp.status_code != 200:
         raise CargoExportError(f"HTTP {resp.status_code}: {resp.text[:500]}")
 
+    # UTF-8 bodies are parsed as raw bytes; any other declared charset goes
+    # through resp.text so requests decodes it as before.
+    encoding = (resp.encoding or "utf-8").lower().replace("_", "-")
+    body: Union[str, bytes] = resp.content if encoding in ("utf-8", "utf8") else resp.text
     ctype = (resp.headers.get("Content-Type") or "").lower()
-    if "json" not in ctype and not resp.text.lstrip().startswith(("[", "{")):
+    starts = (b"[", b"{") if isinstance(body, bytes) else ("[", "{")
+    if "json" not in ctype and not body.lstrip().startswith(starts):
         raise CargoExportError(
             f"Non-JSON response (Content-Type={ctype!r}): {resp.text[:300]!r}"
         )
 
-    return _parse_cargo_json(resp.text)
+    return _parse_cargo_json(body)
 
 
 def cargo_export_paginated(
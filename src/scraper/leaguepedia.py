@@ -11,7 +11,7 @@ Data Source: https://lol.fandom.com/wiki/League_of_Legends_Esports_Wiki
 import mwclient
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 import time
 import logging
 
@@ -37,14 +37,15 @@ class LeaguepediaScraper:
         """
         self.site = mwclient.Site('lol.fandom.com', path='/')
         self.rate_limit = rate_limit
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")
         
     def _respect_rate_limit(self):
         """Ensure we don't overwhelm the API."""
-        elapsed = time.time() - self.last_request_time
+        # monotonic() so wall-clock adjustments can't shorten or stretch the wait
+        elapsed = time.monotonic() - self.last_request_time
         if elapsed < self.rate_limit:
             time.sleep(self.rate_limit - elapsed)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
         
     def cargo_query(
         self,
@@ -97,22 +98,22 @@ class LeaguepediaScraper:
             logger.error(f"Cargo query failed: {e}")
             return []
     
-    def get_all_players(self, region: Optional[str] = None) -> pd.DataFrame:
+    def iter_all_players(self, region: Optional[str] = None) -> Iterator[Dict]:
         """
-        Fetch all professional players.
+        Stream all professional players, one Cargo page at a time.
         
         Args:
             region: Optional region filter (e.g., 'Korea', 'North America')
             
-        Returns:
-            DataFrame with player information
+        Yields:
+            Player result dictionaries as each page arrives
         """
         logger.info(f"Fetching players{f' from {region}' if region else ''}")
         
         fields = "Player, ID, Name, Country, Role, Team, IsRetired"
         where_clause = f"Region='{region}'" if region else ""
         
-        all_results = []
+        fetched = 0
         offset = 0
         
         while True:
@@ -128,11 +129,22 @@ class LeaguepediaScraper:
             if not results:
                 break
                 
-            all_results.extend(results)
+            yield from results
+            fetched += len(results)
             offset += 500
-            logger.info(f"Fetched {len(all_results)} players so far...")
+            logger.info(f"Fetched {fetched} players so far...")
+    
+    def get_all_players(self, region: Optional[str] = None) -> pd.DataFrame:
+        """
+        Fetch all professional players.
+        
+        Args:
+            region: Optional region filter (e.g., 'Korea', 'North America')
             
-        return pd.DataFrame(all_results)
+        Returns:
+            DataFrame with player information
+        """
+        return pd.DataFrame(list(self.iter_all_players(region)))
     
     def get_player_team_history(self, player_id: str) -> pd.DataFrame:
         """
@@ -0,0 +1,87 @@
+"""
+Checks for the Cargo JSON parsing in scrapers/fetch_h2_roster_panel.py.
+
+orjson is optional, so every parser check runs twice: once with orjson and
+once on the stdlib json fallback (orjson patched to None).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scrapers"))
+
+import fetch_h2_roster_panel as cargo  # noqa: E402
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        if cargo.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(cargo, "orjson", None)
+    return request.param
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, encoding: str, content_type: str = "application/json"):
+        self.status_code = 200
+        self.content = content
+        self.encoding = encoding
+        self.headers = {"Content-Type": content_type}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, "replace")
+
+
+class FakeSession:
+    def __init__(self, resp: FakeResponse):
+        self.resp = resp
+
+    def get(self, url, headers=None, timeout=None):
+        return self.resp
+
+
+@pytest.mark.parametrize("payload", ['[{"Name": "é"}, 3]', b'[{"Name": "\xc3\xa9"}, 3]'])
+def test_parse_list_of_rows(json_backend, payload):
+    assert cargo._parse_cargo_json(payload) == [{"Name": "é"}]
+
+
+def test_parse_wrapped_rows(json_backend):
+    assert cargo._parse_cargo_json(b'{"rows": [{"ID": "Faker"}]}') == [{"ID": "Faker"}]
+
+
+def test_parse_blank_body(json_backend):
+    assert cargo._parse_cargo_json(b"  \n") == []
+
+
+@pytest.mark.parametrize("payload", [b"<html>", b'["\xff"]', "[{"])
+def test_invalid_body_raises_cargo_error(json_backend, payload):
+    with pytest.raises(cargo.CargoExportError, match=r"^Invalid JSON from Cargo .*: '"):
+        cargo._parse_cargo_json(payload)
+
+
+def test_unexpected_shape_raises_cargo_error(json_backend):
+    with pytest.raises(cargo.CargoExportError, match="Unexpected Cargo JSON shape"):
+        cargo._parse_cargo_json(b'"just a string"')
+
+
+def test_request_decodes_declared_non_utf8_charset(json_backend):
+    resp = FakeResponse('[{"Name": "é"}]'.encode("latin-1"), encoding="ISO-8859-1")
+    rows = cargo.cargo_export_request({"tables": "Players"}, session=FakeSession(resp))
+    assert rows == [{"Name": "é"}]
+
+
+def test_request_parses_utf8_bytes(json_backend):
+    resp = FakeResponse('[{"Name": "é"}]'.encode("utf-8"), encoding="utf-8")
+    rows = cargo.cargo_export_request({"tables": "Players"}, session=FakeSession(resp))
+    assert rows == [{"Name": "é"}]
+
+
+def test_request_rejects_non_json(json_backend):
+    resp = FakeResponse(b"<html>blocked</html>", encoding="utf-8", content_type="text/html")
+    with pytest.raises(cargo.CargoExportError, match="Non-JSON response"):
+        cargo.cargo_export_request({"tables": "Players"}, session=FakeSession(resp))